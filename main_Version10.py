@@ -2,32 +2,346 @@
 """
 Rectangle + Random Circles DXF Creator (mm) - Auto-fit with Zoom and Mix
 Requires:
-    pip install ezdxf
+    pip install ezdxf numpy
+Optional (much faster circle placement):
+    pip install numba
+    pip install cython   (plus a C compiler: builds placement.pyx on first start)
 """
 from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
 import ezdxf
+import numpy as np
 import sys
-import random
 import math
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional: the placement helper then runs as plain Python
+    def njit(*args, **kwargs):
+        def decorate(func):
+            return func
+        return decorate
+
+try:
+    import pyximport
+except ImportError:  # Cython missing: use _try_place_circles instead
+    _place_circles_ext = None
+else:
+    # compiled sampler for equal circles (placement.pyx next to this file), built on first import;
+    # the .pyx import hook is only needed for that import and is removed again right after
+    _pyx_importers = pyximport.install(language_level=3)
+    try:
+        from placement import place_circles as _place_circles_ext
+    except ImportError:  # no C compiler: pyximport reports the failed build as ImportError
+        _place_circles_ext = None
+    finally:
+        pyximport.uninstall(*_pyx_importers)
+        del _pyx_importers
+
 CANVAS_BG = "#ffffff"
 CANVAS_MIN_W = 800
 CANVAS_MIN_H = 600
 CANVAS_MARGIN_PX = 24  # margin used when auto-fitting
+RESIZE_REDRAW_DELAY_MS = 50  # redraw once this long after the last canvas resize event
 
 GRID_MAJOR_MM = 100
 GRID_MINOR_MM = 20
+GRID_MIN_STEP_PX = 4  # grid lines closer than this would blur together and are not drawn
+GRID_LABEL_FONT = ("Arial", 8)
+GRID_LABEL_GAP_PX = 4  # major grid labels need their own size plus this much room, or they are not drawn
+CIRCLE_LABEL_MIN_R_PX = 12  # circles smaller than this (radius, px) get no diameter label
+
+# below this many placed circles the overlap test scans all of them instead of the spatial grid
+SPATIAL_GRID_MIN_CIRCLES = 32
+
+# Packing density of the circles grown by half the spacing (these never overlap in a valid layout):
+# above PACKING_MAX_FILL no further circle can fit (hexagonal packing tops out at ~0.907).
+# Random sequential placement jams near RANDOM_PACKING_JAM_FILL, so attempts per circle are scaled
+# from a few dozen when the rectangle is nearly empty up to the caller's cap close to that density.
+PACKING_MAX_FILL = 0.9
+RANDOM_PACKING_JAM_FILL = 0.547
+MIN_ATTEMPTS_PER_CIRCLE = 30
+
+# use Poisson-disk sampling for equal circles once the request fills at least this share of the
+# rough capacity (free area / center spacing^2); sparser requests are cheaper by rejection sampling
+POISSON_DISK_MIN_FILL = 0.2
+# candidates tried around each active Poisson-disk sample before it is retired (Bridson's k)
+POISSON_DISK_TRIES = 30
+
+
+@njit(cache=True)
+def _try_place_circles(existing_cxcyr, diams, bounds, min_space, max_attempts, rng, stop_on_fail):
+    """
+    Randomly place circles of the given diameters inside bounds = (x0, y0, w, h) (mm).
+    Each circle keeps min_space edge-to-edge to the rectangle edges, to the existing circles
+    (an (N, 3) array of cx, cy, r) and to the circles placed before it. Every circle gets up to
+    max_attempts random candidates (fewer while the rectangle is sparsely filled); if none fit it is
+    skipped, or placement stops when stop_on_fail. Candidates are drawn from rng (a np.random.Generator).
+    Returns an (n, 3) array of cx, cy, r for the placed circles.
+    """
+    x0 = bounds[0]
+    y0 = bounds[1]
+    w = bounds[2]
+    h = bounds[3]
+    n_existing = existing_cxcyr.shape[0]
+    total = n_existing + diams.shape[0]
+    all_x = np.empty(total)
+    all_y = np.empty(total)
+    all_r = np.empty(total)
+
+    # uniform grid over the rectangle; cells span the largest allowed center distance so only the
+    # 3x3 neighbourhood of a candidate needs checking. Cells are linked lists: head[cell] -> nxt[i]
+    max_r = 0.0
+    for i in range(n_existing):
+        max_r = max(max_r, existing_cxcyr[i, 2])
+    for i in range(diams.shape[0]):
+        max_r = max(max_r, 0.5 * diams[i])
+    cell = 2.0 * (max_r + min_space)
+    # keep the number of cells proportional to the number of circles for tiny diameters
+    cell = max(cell, math.sqrt(w * h / (4.0 * total + 1.0)))
+    nx = int(w // cell) + 1
+    ny = int(h // cell) + 1
+    head = np.full(nx * ny, -1, dtype=np.int64)
+    nxt = np.empty(total, dtype=np.int64)
+    # minimum center distance (and its square) from the circle being placed (radius ma2_r) to each placed
+    # circle; consecutive circles usually share a diameter, so it is only refreshed when r changes
+    ma1 = np.empty(total)
+    ma2 = np.empty(total)
+    ma2_r = -1.0
+    # area of the placed circles grown by half the spacing, against the rectangle shrunk by the same
+    used_area = 0.0
+    fill_area = max((w - min_space) * (h - min_space), 1e-12)
+
+    n = 0
+    for i in range(n_existing + diams.shape[0]):
+        if i < n_existing:
+            cx = existing_cxcyr[i, 0]
+            cy = existing_cxcyr[i, 1]
+            r = existing_cxcyr[i, 2]
+        else:
+            r = 0.5 * diams[i - n_existing]
+            lo_x = x0 + r + min_space
+            hi_x = x0 + w - r - min_space
+            lo_y = y0 + r + min_space
+            hi_y = y0 + h - r - min_space
+            found = False
+            grown = r + 0.5 * min_space
+            fill = (used_area + math.pi * grown * grown) / fill_area
+            if lo_x < hi_x and lo_y < hi_y and fill <= PACKING_MAX_FILL:
+                attempts = int(50.0 / (1.0 - min(fill / RANDOM_PACKING_JAM_FILL, 0.95)))
+                attempts = min(max_attempts, max(MIN_ATTEMPTS_PER_CIRCLE, attempts))
+                if r != ma2_r:
+                    ma2_r = r
+                    for j in range(n):
+                        ma = r + all_r[j] + min_space
+                        ma1[j] = ma
+                        ma2[j] = ma * ma
+                xs = rng.uniform(lo_x, hi_x, attempts)
+                ys = rng.uniform(lo_y, hi_y, attempts)
+                for a in range(attempts):
+                    cx = xs[a]
+                    cy = ys[a]
+                    ok = True
+                    if n < SPATIAL_GRID_MIN_CIRCLES:
+                        for j in range(n):
+                            # cheap bounding-box rejection before the squared distance
+                            ma = ma1[j]
+                            dx = cx - all_x[j]
+                            dy = cy - all_y[j]
+                            if -ma < dx < ma and -ma < dy < ma and dx * dx + dy * dy < ma2[j]:
+                                ok = False
+                                break
+                    else:
+                        ix = min(max(int((cx - x0) // cell), 0), nx - 1)
+                        iy = min(max(int((cy - y0) // cell), 0), ny - 1)
+                        for gy in range(max(iy - 1, 0), min(iy + 2, ny)):
+                            for gx in range(max(ix - 1, 0), min(ix + 2, nx)):
+                                j = head[gy * nx + gx]
+                                while j >= 0:
+                                    ma = ma1[j]
+                                    dx = cx - all_x[j]
+                                    dy = cy - all_y[j]
+                                    if -ma < dx < ma and -ma < dy < ma and dx * dx + dy * dy < ma2[j]:
+                                        ok = False
+                                        break
+                                    j = nxt[j]
+                                if not ok:
+                                    break
+                            if not ok:
+                                break
+                    if ok:
+                        found = True
+                        break
+            if not found:
+                if stop_on_fail:
+                    break
+                continue
+        all_x[n] = cx
+        all_y[n] = cy
+        all_r[n] = r
+        ma = ma2_r + r + min_space
+        ma1[n] = ma
+        ma2[n] = ma * ma
+        # only circles reaching into the rectangle (e.g. not ones left outside after it was changed) fill it
+        reach = r + min_space
+        if x0 - reach < cx < x0 + w + reach and y0 - reach < cy < y0 + h + reach:
+            used_area += math.pi * (r + 0.5 * min_space) * (r + 0.5 * min_space)
+        # existing circles may lie outside a since-changed rectangle: clamp them into edge cells
+        ix = min(max(int((cx - x0) // cell), 0), nx - 1)
+        iy = min(max(int((cy - y0) // cell), 0), ny - 1)
+        nxt[n] = head[iy * nx + ix]
+        head[iy * nx + ix] = n
+        n += 1
+
+    placed = np.empty((n - n_existing, 3))
+    for i in range(n_existing, n):
+        placed[i - n_existing, 0] = all_x[i]
+        placed[i - n_existing, 1] = all_y[i]
+        placed[i - n_existing, 2] = all_r[i]
+    return placed
+
+
+@njit(cache=True)
+def _poisson_disk_centers(bounds, spacing, tries, rng):
+    """
+    Bridson's Poisson-disk sampling: fill the box bounds = (x_min, y_min, x_max, y_max) (mm) with
+    random points at least spacing apart. Each active point gets up to tries candidates in the
+    annulus [spacing, 2*spacing] before it is retired. Points are drawn from rng (a np.random.Generator).
+    Returns an (n, 2) array of points.
+    """
+    x_min = bounds[0]
+    y_min = bounds[1]
+    w = bounds[2] - x_min
+    h = bounds[3] - y_min
+    spacing2 = spacing * spacing
+    # cell diagonal == spacing, so every cell holds at most one point
+    cell = spacing / math.sqrt(2.0)
+    nx = int(w / cell) + 1
+    ny = int(h / cell) + 1
+    grid = np.full(nx * ny, -1, dtype=np.int64)
+    pts = np.empty((nx * ny, 2))
+    active = np.empty(nx * ny, dtype=np.int64)
+
+    pts[0, 0] = x_min + rng.random() * w
+    pts[0, 1] = y_min + rng.random() * h
+    grid[min(int((pts[0, 1] - y_min) / cell), ny - 1) * nx + min(int((pts[0, 0] - x_min) / cell), nx - 1)] = 0
+    active[0] = 0
+    n_active = 1
+    n = 1
+    while n_active > 0:
+        a = rng.integers(0, n_active)
+        px = pts[active[a], 0]
+        py = pts[active[a], 1]
+        found = False
+        for _ in range(tries):
+            # uniform by area in the annulus around the active point
+            dist = spacing * math.sqrt(1.0 + 3.0 * rng.random())
+            angle = 2.0 * math.pi * rng.random()
+            qx = px + dist * math.cos(angle)
+            qy = py + dist * math.sin(angle)
+            if qx < x_min or qx > x_min + w or qy < y_min or qy > y_min + h:
+                continue
+            ix = min(int((qx - x_min) / cell), nx - 1)
+            iy = min(int((qy - y_min) / cell), ny - 1)
+            ok = True
+            for gy in range(max(iy - 2, 0), min(iy + 3, ny)):
+                for gx in range(max(ix - 2, 0), min(ix + 3, nx)):
+                    j = grid[gy * nx + gx]
+                    if j >= 0:
+                        dx = qx - pts[j, 0]
+                        dy = qy - pts[j, 1]
+                        if dx * dx + dy * dy < spacing2:
+                            ok = False
+                            break
+                if not ok:
+                    break
+            if ok:
+                pts[n, 0] = qx
+                pts[n, 1] = qy
+                grid[iy * nx + ix] = n
+                active[n_active] = n
+                n_active += 1
+                n += 1
+                found = True
+                break
+        if not found:
+            n_active -= 1
+            active[a] = active[n_active]
+    return pts[:n].copy()
+
+
+@njit(cache=True)
+def _clear_of_circles(points, r, min_space, existing_cxcyr):
+    """
+    For circles of radius r centered at points ((n, 2) array), return a boolean mask of those that keep
+    min_space edge-to-edge to every existing circle ((N, 3) array of cx, cy, r).
+    """
+    n_points = points.shape[0]
+    n_existing = existing_cxcyr.shape[0]
+    mask = np.ones(n_points, dtype=np.bool_)
+    if n_existing == 0 or n_points == 0:
+        return mask
+    # grid over the existing circles spanning the largest allowed center distance
+    x_min = existing_cxcyr[0, 0]
+    y_min = existing_cxcyr[0, 1]
+    x_max = x_min
+    y_max = y_min
+    max_r = 0.0
+    for i in range(n_existing):
+        x_min = min(x_min, existing_cxcyr[i, 0])
+        y_min = min(y_min, existing_cxcyr[i, 1])
+        x_max = max(x_max, existing_cxcyr[i, 0])
+        y_max = max(y_max, existing_cxcyr[i, 1])
+        max_r = max(max_r, existing_cxcyr[i, 2])
+    cell = r + max_r + min_space
+    cell = max(cell, math.sqrt((x_max - x_min) * (y_max - y_min) / (4.0 * n_existing + 1.0)))
+    nx = int((x_max - x_min) // cell) + 1
+    ny = int((y_max - y_min) // cell) + 1
+    head = np.full(nx * ny, -1, dtype=np.int64)
+    nxt = np.empty(n_existing, dtype=np.int64)
+    # every point has radius r, so the minimum center distance per existing circle is fixed
+    ma1 = np.empty(n_existing)
+    ma2 = np.empty(n_existing)
+    for i in range(n_existing):
+        ma = r + existing_cxcyr[i, 2] + min_space
+        ma1[i] = ma
+        ma2[i] = ma * ma
+        k = int((existing_cxcyr[i, 1] - y_min) // cell) * nx + int((existing_cxcyr[i, 0] - x_min) // cell)
+        nxt[i] = head[k]
+        head[k] = i
+
+    for p in range(n_points):
+        cx = points[p, 0]
+        cy = points[p, 1]
+        ix = int((cx - x_min) // cell)
+        iy = int((cy - y_min) // cell)
+        for gy in range(max(iy - 1, 0), min(iy + 2, ny)):
+            for gx in range(max(ix - 1, 0), min(ix + 2, nx)):
+                j = head[gy * nx + gx]
+                while j >= 0:
+                    ma = ma1[j]
+                    dx = cx - existing_cxcyr[j, 0]
+                    dy = cy - existing_cxcyr[j, 1]
+                    if -ma < dx < ma and -ma < dy < ma and dx * dx + dy * dy < ma2[j]:
+                        mask[p] = False
+                        break
+                    j = nxt[j]
+                if not mask[p]:
+                    break
+            if not mask[p]:
+                break
+    return mask
 
 class RectangleApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, seed: int | None = None):
         super().__init__()
         self.title("Rectangle + Random Circles DXF Creator (mm) - Auto-fit + Zoom + Mix")
         self.minsize(CANVAS_MIN_W + 380, CANVAS_MIN_H + 20)
 
         # Rectangle parameters (mm) - default rectangle 800 x 2000 mm
-        self.x0_var = tk.DoubleVar(value=10.0)          # top-left of bounding box in mm
+        self.x0_var = tk.DoubleVar(value=10.0)          # bottom-left of bounding box in mm
         self.y0_var = tk.DoubleVar(value=10.0)
         self.width_var = tk.DoubleVar(value=800.0)      # width in mm
         self.height_var = tk.DoubleVar(value=2000.0)    # height in mm
@@ -51,6 +365,8 @@ class RectangleApp(tk.Tk):
         # internal state
         self.canvas_w = CANVAS_MIN_W
         self.canvas_h = CANVAS_MIN_H
+        # pending after() id of the debounced resize redraw
+        self._resize_after = None
 
         # store shapes
         self.rect = {
@@ -59,8 +375,19 @@ class RectangleApp(tk.Tk):
             "w_mm": float(self.width_var.get()),
             "h_mm": float(self.height_var.get()),
         }
-        # circles: list of dicts {"cx_mm":..., "cy_mm":..., "d_mm":...}
-        self.circles: list[dict] = []
+        # circles: parallel arrays of center x, center y and diameter (mm)
+        self._cx = np.empty(0)
+        self._cy = np.empty(0)
+        self._d = np.empty(0)
+        # circle index -> canvas id of its diameter label, for circles large enough to show one
+        self._circle_labels: dict[int, int] = {}
+        # (px_per_mm, x_offset_px, y_offset_px) the "shape" items are currently drawn with
+        self._view: tuple[float, float, float] | None = None
+        # reusable grid/axis canvas items: pool name -> item ids, and how many of them are shown
+        self._grid_pools: dict[str, list[int]] = {}
+        self._grid_shown: dict[str, int] = {}
+        # random generator for circle placement (pass a seed for reproducible layouts)
+        self._rng = np.random.default_rng(seed)
 
         # Build UI
         self._build_ui()
@@ -81,10 +408,10 @@ class RectangleApp(tk.Tk):
         form = ttk.Frame(panel)
         form.pack(anchor="w", pady=(0,6))
 
-        ttk.Label(form, text="X0 (mm) - top-left:").grid(row=0, column=0, sticky="w", pady=3)
+        ttk.Label(form, text="X0 (mm) - bottom-left:").grid(row=0, column=0, sticky="w", pady=3)
         ttk.Entry(form, textvariable=self.x0_var, width=14).grid(row=0, column=1, padx=6, pady=3)
 
-        ttk.Label(form, text="Y0 (mm) - top-left:").grid(row=1, column=0, sticky="w", pady=3)
+        ttk.Label(form, text="Y0 (mm) - bottom-left:").grid(row=1, column=0, sticky="w", pady=3)
         ttk.Entry(form, textvariable=self.y0_var, width=14).grid(row=1, column=1, padx=6, pady=3)
 
         ttk.Label(form, text="Width (mm):").grid(row=2, column=0, sticky="w", pady=3)
@@ -160,18 +487,27 @@ class RectangleApp(tk.Tk):
                                      padx=8, pady=6)
         self.save_button.pack(fill="x", pady=(0,8))
 
-        notes = ("Notes:\n- Units are millimetres (mm).\n- X increases to the right, Y increases downward on the canvas.\n- Circles are placed randomly within the rectangle and will respect the minimum spacing (edge-to-edge),\n  including spacing to rectangle edges.\n- Mix will attempt to reposition existing circles (keeping diameters) with the same spacing rule.\n- Save exports mm units and sets INSUNITS to millimetres.")
+        notes = ("Notes:\n- Units are millimetres (mm).\n- X increases to the right, Y increases upward (same as the DXF).\n- Circles are placed randomly within the rectangle and will respect the minimum spacing (edge-to-edge),\n  including spacing to rectangle edges.\n- Mix will attempt to reposition existing circles (keeping diameters) with the same spacing rule.\n- Save exports mm units and sets INSUNITS to millimetres.")
         ttk.Label(panel, text=notes, wraplength=360).pack(anchor="w", pady=(4,0))
 
         # Canvas (resizable)
         self.canvas = tk.Canvas(self, bg=CANVAS_BG, highlightthickness=1, highlightbackground="#888")
+        # used to measure grid labels, to skip them when they would overlap
+        self.grid_label_font = tkfont.Font(self, font=GRID_LABEL_FONT)
         self.canvas.pack(side=tk.LEFT, fill="both", expand=True, padx=8, pady=8)
 
     # -------------------- Events / actions --------------------
     def on_canvas_configure(self, event):
-        # canvas resized -> update stored size and redraw (recompute auto-fit if enabled)
+        # canvas resized -> update stored size and redraw (recompute auto-fit if enabled);
+        # a resize drag sends many events, so only redraw once they stop
         self.canvas_w = max(1, event.width)
         self.canvas_h = max(1, event.height)
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+        self._resize_after = self.after(RESIZE_REDRAW_DELAY_MS, self._on_resize_settled)
+
+    def _on_resize_settled(self):
+        self._resize_after = None
         self.redraw()
 
     def on_fit_toggle(self):
@@ -218,28 +554,62 @@ class RectangleApp(tk.Tk):
         # remove rectangle and circles (clear visual overlay but keep params)
         self.canvas.delete("shape")
         self.canvas.delete("overlay")
+        self._circle_labels = {}
+        self._view = None
+        self._grid_pools = {}
+        self._grid_shown = {}
 
     # -------------------- Zoom --------------------
     def zoom_in(self):
         cur = float(self.zoom_var.get())
         cur *= 1.2
         self.zoom_var.set(min(cur, 10.0))
-        self.redraw()
+        self.apply_zoom()
 
     def zoom_out(self):
         cur = float(self.zoom_var.get())
         cur /= 1.2
         self.zoom_var.set(max(cur, 0.05))
-        self.redraw()
+        self.apply_zoom()
 
     def zoom_reset(self):
         self.zoom_var.set(1.0)
-        self.redraw()
+        self.apply_zoom()
+
+    def apply_zoom(self):
+        """Rescale the existing shape items to the current zoom and redraw only the grid."""
+        old = self._view
+        if old is None:
+            self.redraw()
+            return
+        view = self.current_view()
+        f = view[0] / old[0]
+        if f != 1.0:
+            # zooming keeps one canvas point fixed; recover it from the old and new offsets
+            ax = (view[1] - f * old[1]) / (1.0 - f)
+            ay = (view[2] - f * old[2]) / (1.0 - f)
+            self.canvas.scale("shape", ax, ay, f, f)
+            # labels sit a fixed number of px from their anchor point; undo the scaling of that offset
+            self.canvas.move("circle_label", 4 - 4 * f, 4 * f - 4)
+            self.canvas.move("rect_label", 6 - 6 * f, 6 - 6 * f)
+            self._sync_circle_labels(*view)
+        self._view = view
+        self.update_scale_label(view[0])
+        self._redraw_grid(*view)
+        # the shapes were kept, so grid items created just now would sit on top of them
+        self.canvas.tag_lower("overlay")
 
     # -------------------- Circles --------------------
+    def _set_circles(self, cx, cy, d):
+        self._cx = np.asarray(cx, dtype=float)
+        self._cy = np.asarray(cy, dtype=float)
+        self._d = np.asarray(d, dtype=float)
+
     def clear_circles(self):
-        self.circles.clear()
-        self.redraw()
+        self._set_circles(np.empty(0), np.empty(0), np.empty(0))
+        self.canvas.delete("circle")
+        self.canvas.delete("circle_label")
+        self._circle_labels = {}
 
     def add_random_circles(self):
         # Read parameters
@@ -254,10 +624,7 @@ class RectangleApp(tk.Tk):
             return
 
         # Ensure rectangle exists and has space (account for min spacing to rectangle edges)
-        x0 = self.rect["x0_mm"]
-        y0 = self.rect["y0_mm"]
-        w = self.rect["w_mm"]
-        h = self.rect["h_mm"]
+        x0, y0, w, h = self._rect()
         r = diam / 2.0
 
         # To keep edge-to-edge spacing >= min_space, center must be >= r + min_space from rectangle edges.
@@ -265,44 +632,46 @@ class RectangleApp(tk.Tk):
             messagebox.showwarning("Too large / spacing too big", "Circle diameter and/or minimum spacing are too large to fit inside the rectangle.")
             return
 
-        placed = 0
         max_attempts_per_circle = 600
-        new_circles = []
-
-        for i in range(count):
-            placed_this = False
-            attempts = 0
-            while attempts < max_attempts_per_circle and not placed_this:
-                attempts += 1
-                cx = random.uniform(x0 + r + min_space, x0 + w - r - min_space)
-                cy = random.uniform(y0 + r + min_space, y0 + h - r - min_space)
-                # check overlap with existing circles (both previously existing and newly placed)
-                ok = True
-                for c in self.circles:
-                    dist = math.hypot(cx - c["cx_mm"], cy - c["cy_mm"])
-                    min_allowed = r + (c["d_mm"] / 2.0) + min_space
-                    if dist < min_allowed:
-                        ok = False
-                        break
-                if not ok:
-                    continue
-                for c in new_circles:
-                    dist = math.hypot(cx - c["cx_mm"], cy - c["cy_mm"])
-                    min_allowed = r + (c["d_mm"] / 2.0) + min_space
-                    if dist < min_allowed:
-                        ok = False
-                        break
-                if ok:
-                    new_circles.append({"cx_mm": cx, "cy_mm": cy, "d_mm": diam})
-                    placed += 1
-                    placed_this = True
-            if not placed_this:
-                # Could not place this circle without violating spacing after many attempts: stop trying further
-                break
-
-        # append new circles to global list and redraw
-        self.circles.extend(new_circles)
-        self.redraw()
+        existing = np.column_stack((self._cx, self._cy, 0.5 * self._d))
+        placed_arr = np.empty((0, 3))
+
+        # dense requests: take a random subset of a Poisson-disk fill of the free center area
+        spacing = diam + min_space
+        free_w = w - 2 * (r + min_space)
+        free_h = h - 2 * (r + min_space)
+        if min_space > 0 and count >= POISSON_DISK_MIN_FILL * free_w * free_h / (spacing * spacing):
+            centers = _poisson_disk_centers(np.array([x0 + r + min_space, y0 + r + min_space,
+                                                      x0 + w - r - min_space, y0 + h - r - min_space]),
+                                            spacing, POISSON_DISK_TRIES, self._rng)
+            centers = centers[_clear_of_circles(centers, r, min_space, existing)]
+            centers = self._rng.permutation(centers)[:count]
+            placed_arr = np.column_stack((centers, np.full(len(centers), r)))
+
+        # rejection sampling for the rest (or all) of the requested circles
+        if len(placed_arr) < count:
+            obstacles = np.concatenate((existing, placed_arr))
+            if _place_circles_ext is not None:
+                more = _place_circles_ext(np.ascontiguousarray(obstacles[:, 0]), np.ascontiguousarray(obstacles[:, 1]),
+                                          2.0 * obstacles[:, 2], diam, count - len(placed_arr), min_space,
+                                          x0, y0, w, h, max_attempts_per_circle, self._placement_seed(),
+                                          PACKING_MAX_FILL, RANDOM_PACKING_JAM_FILL, MIN_ATTEMPTS_PER_CIRCLE)
+            else:
+                more = _try_place_circles(obstacles, np.full(count - len(placed_arr), diam),
+                                          np.array([x0, y0, w, h], dtype=float),
+                                          min_space, max_attempts_per_circle, self._rng, True)
+            placed_arr = np.concatenate((placed_arr, more))
+        placed = len(placed_arr)
+        start = len(self._d)
+
+        # append new circles to the existing ones and draw only those
+        self._set_circles(np.concatenate((self._cx, placed_arr[:, 0])),
+                          np.concatenate((self._cy, placed_arr[:, 1])),
+                          np.concatenate((self._d, np.full(placed, diam))))
+        if self._view is None:
+            self.redraw()
+        else:
+            self._draw_circles(start, *self._view)
 
         if placed < count:
             messagebox.showwarning(
@@ -314,55 +683,30 @@ class RectangleApp(tk.Tk):
 
     def mix_circles(self):
         """Reposition already created circles (keep diameters)."""
-        if not self.circles:
+        if not len(self._d):
             # no popup necessary
             return
 
-        # Extract diameters (keep count)
-        diameters = [c["d_mm"] for c in self.circles]
-        # Sort descending to place large ones first (better packing)
-        diameters.sort(reverse=True)
+        # Extract diameters (keep count), sorted descending to place large ones first (better packing)
+        diameters = np.sort(self._d)[::-1]
 
         # Attempt to place same number of circles with same diameters
-        x0 = self.rect["x0_mm"]
-        y0 = self.rect["y0_mm"]
-        w = self.rect["w_mm"]
-        h = self.rect["h_mm"]
+        x0, y0, w, h = self._rect()
         min_space = float(self.circle_min_spacing_var.get())
 
-        new_circles: list[dict] = []
         max_attempts_per_circle = 800
-        placed = 0
-
-        for diam in diameters:
-            r = diam / 2.0
-            # require room within rectangle considering min spacing to edges
-            if w <= 2 * (r + min_space) or h <= 2 * (r + min_space):
-                # cannot place this diameter at all; skip it
-                continue
-            placed_this = False
-            attempts = 0
-            while attempts < max_attempts_per_circle and not placed_this:
-                attempts += 1
-                cx = random.uniform(x0 + r + min_space, x0 + w - r - min_space)
-                cy = random.uniform(y0 + r + min_space, y0 + h - r - min_space)
-                ok = True
-                # check with already placed new circles
-                for c in new_circles:
-                    dist = math.hypot(cx - c["cx_mm"], cy - c["cy_mm"])
-                    min_allowed = r + (c["d_mm"] / 2.0) + min_space
-                    if dist < min_allowed:
-                        ok = False
-                        break
-                if ok:
-                    new_circles.append({"cx_mm": cx, "cy_mm": cy, "d_mm": diam})
-                    placed += 1
-                    placed_this = True
-            # if not placed_this -> skip this diameter and continue with others
-
-        old_count = len(self.circles)
-        self.circles = new_circles
-        self.redraw()
+        # circles that cannot fit at all, or find no free spot, are skipped
+        placed_arr = _try_place_circles(np.empty((0, 3)), np.ascontiguousarray(diameters),
+                                        np.array([x0, y0, w, h], dtype=float),
+                                        min_space, max_attempts_per_circle, self._rng, False)
+        placed = len(placed_arr)
+
+        old_count = len(self._d)
+        self._set_circles(placed_arr[:, 0].copy(), placed_arr[:, 1].copy(), 2.0 * placed_arr[:, 2])
+        if self._view is None:
+            self.redraw()
+        else:
+            self._redraw_shapes(*self._view)
 
         if placed < old_count:
             messagebox.showwarning(
@@ -372,19 +716,27 @@ class RectangleApp(tk.Tk):
             )
         # else: no popup on success per request
 
+    def _placement_seed(self):
+        # seed for the compiled sampler, drawn from self._rng so a seeded app stays reproducible
+        return int(self._rng.integers(0, 2**31 - 1))
+
     # -------------------- Drawing helpers --------------------
+    def _rect(self):
+        """Return the rectangle as (x0_mm, y0_mm, w_mm, h_mm)."""
+        r = self.rect
+        return r["x0_mm"], r["y0_mm"], r["w_mm"], r["h_mm"]
+
     def compute_px_per_mm_and_offset(self):
         """
         Compute effective px_per_mm and x_offset_px,y_offset_px mapping from model mm coords to canvas px.
+        The model is Y-up, the canvas Y-down: x_px = x_mm * px_per_mm + x_offset_px,
+        y_px = y_offset_px - y_mm * px_per_mm (y_offset_px is the canvas row of model y = 0).
         Applies zoom multiplier on top of computed or manual px/mm.
         Returns: effective_px_per_mm, x_offset_px, y_offset_px, bbox_min_x, bbox_min_y
         """
         zoom = float(self.zoom_var.get())
         # get bounding box of rectangle in mm
-        x0 = self.rect["x0_mm"]
-        y0 = self.rect["y0_mm"]
-        w = self.rect["w_mm"]
-        h = self.rect["h_mm"]
+        x0, y0, w, h = self._rect()
         min_x = x0
         max_x = x0 + w
         min_y = y0
@@ -404,7 +756,7 @@ class RectangleApp(tk.Tk):
                 base_px_per_mm = 1.0
             effective_px_per_mm = base_px_per_mm * zoom
             x_offset_px = CANVAS_MARGIN_PX - (min_x * effective_px_per_mm)
-            y_offset_px = CANVAS_MARGIN_PX - (min_y * effective_px_per_mm)
+            y_offset_px = CANVAS_MARGIN_PX + (max_y * effective_px_per_mm)
             return effective_px_per_mm, x_offset_px, y_offset_px, min_x, min_y
         else:
             try:
@@ -415,15 +767,11 @@ class RectangleApp(tk.Tk):
                 manual_px = 1.0
                 self.px_per_mm_var.set(manual_px)
             effective_px_per_mm = manual_px * zoom
+            # model origin at the bottom-left corner of the canvas
             x_offset_px = 0.0
-            y_offset_px = 0.0
+            y_offset_px = float(self.canvas_h)
             return effective_px_per_mm, x_offset_px, y_offset_px, 0.0, 0.0
 
-    def mm_to_canvas_px(self, x_mm, y_mm, px_per_mm, x_offset_px, y_offset_px):
-        x_px = x_mm * px_per_mm + x_offset_px
-        y_px = y_mm * px_per_mm + y_offset_px
-        return x_px, y_px
-
     def update_scale_label(self, effective_px_per_mm):
         try:
             zoom_pct = int(round(self.zoom_var.get() * 100))
@@ -436,99 +784,180 @@ class RectangleApp(tk.Tk):
             text = f"Scale: -- px/mm  ({zoom_pct}%)"
         self.scale_label.config(text=text)
 
-    def redraw(self):
-        """Redraw grid, axes, rectangle and the circles according to current parameters and scale."""
-        self.canvas.delete("overlay")
-        self.canvas.delete("shape")
-
+    def current_view(self):
+        """Return (px_per_mm, x_offset_px, y_offset_px) for drawing; px_per_mm is always > 0."""
         px_per_mm, x_off, y_off, bbox_min_x, bbox_min_y = self.compute_px_per_mm_and_offset()
-        self.update_scale_label(px_per_mm)
-
         try:
             px_per_mm_f = float(px_per_mm)
             if px_per_mm_f <= 0:
                 px_per_mm_f = 1.0
         except Exception:
             px_per_mm_f = 1.0
+        return px_per_mm_f, x_off, y_off
+
+    def redraw(self):
+        """Redraw grid, axes, rectangle and the circles according to current parameters and scale."""
+        view = self.current_view()
+        self.update_scale_label(view[0])
+        self._redraw_grid(*view)
+        self._redraw_shapes(*view)
+
+        if self.auto_fit_var.get():
+            self.px_entry.state(["disabled"])
+        else:
+            self.px_entry.state(["!disabled"])
+
+    def _pool_items(self, name, count, create):
+        """
+        Return count canvas items from the named pool, creating missing ones with create().
+        Items beyond count are hidden; previously hidden items that are needed again are shown.
+        """
+        pool = self._grid_pools.setdefault(name, [])
+        shown = self._grid_shown.get(name, 0)
+        while len(pool) < count:
+            pool.append(create())
+        for item in pool[shown:count]:
+            self.canvas.itemconfigure(item, state="normal")
+        for item in pool[count:shown]:
+            self.canvas.itemconfigure(item, state="hidden")
+        self._grid_shown[name] = count
+        return pool[:count]
+
+    @staticmethod
+    def _grid_positions(step_px, limit_px):
+        # positions 0, step, 2*step, ... up to limit (same stepping as the original while loops)
+        positions = []
+        p = 0.0
+        while p <= limit_px:
+            positions.append(p)
+            p += step_px
+        return positions
+
+    def _redraw_grid(self, px_per_mm_f, x_off, y_off):
+        """Update grid lines, grid labels and axis arrows (the "overlay" items), reusing existing items."""
+        canvas = self.canvas
+        w = self.canvas_w
+        h = self.canvas_h
+
+        def line(fill):
+            return lambda: canvas.create_line(0, 0, 0, 0, fill=fill, tags="overlay")
+
+        def label():
+            return canvas.create_text(0, 0, text="", anchor="nw", fill="#666", font=GRID_LABEL_FONT, tags="overlay")
 
         # draw minor grid
         minor_step_px = GRID_MINOR_MM * px_per_mm_f
-        if minor_step_px >= 4:
-            x = 0.0
-            while x <= self.canvas_w:
-                self.canvas.create_line(x, 0, x, self.canvas_h, fill="#f7f7f7", tags="overlay")
-                x += minor_step_px
-            y = 0.0
-            while y <= self.canvas_h:
-                self.canvas.create_line(0, y, self.canvas_w, y, fill="#f7f7f7", tags="overlay")
-                y += minor_step_px
+        if minor_step_px >= GRID_MIN_STEP_PX:
+            xs = self._grid_positions(minor_step_px, w)
+            ys = self._grid_positions(minor_step_px, h)
+        else:
+            xs = ys = []
+        for item, x in zip(self._pool_items("minor_x", len(xs), line("#f7f7f7")), xs):
+            canvas.coords(item, x, 0, x, h)
+        for item, y in zip(self._pool_items("minor_y", len(ys), line("#f7f7f7")), ys):
+            canvas.coords(item, 0, y, w, y)
 
         # major grid
         major_step_px = GRID_MAJOR_MM * px_per_mm_f
-        x = 0.0
-        while x <= self.canvas_w:
-            self.canvas.create_line(x, 0, x, self.canvas_h, fill="#e8e8e8", tags="overlay")
-            mm_val = (x - x_off) / px_per_mm_f
-            if -10000 < mm_val < 10000:
-                self.canvas.create_text(x + 2, 2, text=f"{int(round(mm_val))}", anchor="nw", fill="#666", font=("Arial", 8), tags="overlay")
-            x += major_step_px
-        y = 0.0
-        while y <= self.canvas_h:
-            self.canvas.create_line(0, y, self.canvas_w, y, fill="#e8e8e8", tags="overlay")
-            mm_val = (y - y_off) / px_per_mm_f
-            if -10000 < mm_val < 10000:
-                self.canvas.create_text(2, y + 2, text=f"{int(round(mm_val))}", anchor="nw", fill="#666", font=("Arial", 8), tags="overlay")
-            y += major_step_px
-
-        # axis arrows
-        ox_px, oy_px = 12, 12
+        if major_step_px >= GRID_MIN_STEP_PX:
+            xs = self._grid_positions(major_step_px, w)
+            ys = self._grid_positions(major_step_px, h)
+        else:
+            xs = ys = []
+        for item, x in zip(self._pool_items("major_x", len(xs), line("#e8e8e8")), xs):
+            canvas.coords(item, x, 0, x, h)
+        for item, y in zip(self._pool_items("major_y", len(ys), line("#e8e8e8")), ys):
+            canvas.coords(item, 0, y, w, y)
+        # X labels sit side by side, so they need their width; Y labels are stacked, so only their height
+        x_labels = [(x, (x - x_off) / px_per_mm_f) for x in xs]
+        x_labels = [(x, mm_val) for x, mm_val in x_labels if -10000 < mm_val < 10000]
+        if x_labels:
+            widest = max(self.grid_label_font.measure(f"{int(round(mm_val))}") for _, mm_val in x_labels)
+            if major_step_px < widest + GRID_LABEL_GAP_PX:
+                x_labels = []
+        if major_step_px < self.grid_label_font.metrics("linespace") + GRID_LABEL_GAP_PX:
+            ys = []
+        for item, (x, mm_val) in zip(self._pool_items("label_x", len(x_labels), label), x_labels):
+            canvas.coords(item, x + 2, 2)
+            canvas.itemconfigure(item, text=f"{int(round(mm_val))}")
+        y_labels = [(y, (y_off - y) / px_per_mm_f) for y in ys]
+        y_labels = [(y, mm_val) for y, mm_val in y_labels if -10000 < mm_val < 10000]
+        for item, (y, mm_val) in zip(self._pool_items("label_y", len(y_labels), label), y_labels):
+            canvas.coords(item, 2, y + 2)
+            canvas.itemconfigure(item, text=f"{int(round(mm_val))}")
+
+        # axis arrows in the bottom-left corner (created once, then only moved)
+        ox_px, oy_px = 12, h - 12
         arrow_len_px = min(120, int(40 * px_per_mm_f))
-        self.canvas.create_line(ox_px, oy_px, ox_px + arrow_len_px, oy_px, arrow=tk.LAST, width=2, fill="#111", tags="overlay")
-        self.canvas.create_text(ox_px + arrow_len_px + 6, oy_px - 6, text="+X", anchor="nw", font=("Arial", 10, "bold"), tags="overlay")
-        self.canvas.create_line(ox_px, oy_px, ox_px, oy_px + arrow_len_px, arrow=tk.LAST, width=2, fill="#111", tags="overlay")
-        self.canvas.create_text(ox_px + 6, oy_px + arrow_len_px + 2, text="+Y", anchor="nw", font=("Arial", 10, "bold"), tags="overlay")
-        self.canvas.create_text(ox_px + 6, oy_px + 10, text="(0,0)", anchor="nw", font=("Arial", 9), tags="overlay")
+        axis = self._grid_pools.get("axis")
+        if axis is None:
+            axis = self._grid_pools["axis"] = [
+                canvas.create_line(0, 0, 0, 0, arrow=tk.LAST, width=2, fill="#111", tags="overlay"),
+                canvas.create_text(0, 0, text="+X", anchor="nw", font=("Arial", 10, "bold"), tags="overlay"),
+                canvas.create_line(0, 0, 0, 0, arrow=tk.LAST, width=2, fill="#111", tags="overlay"),
+                canvas.create_text(0, 0, text="+Y", anchor="sw", font=("Arial", 10, "bold"), tags="overlay"),
+                canvas.create_text(0, 0, text="(0,0)", anchor="sw", font=("Arial", 9), tags="overlay"),
+            ]
+        canvas.coords(axis[0], ox_px, oy_px, ox_px + arrow_len_px, oy_px)
+        canvas.coords(axis[1], ox_px + arrow_len_px + 6, oy_px - 6)
+        canvas.coords(axis[2], ox_px, oy_px, ox_px, oy_px - arrow_len_px)
+        canvas.coords(axis[3], ox_px + 6, oy_px - arrow_len_px - 2)
+        canvas.coords(axis[4], ox_px + 6, oy_px - 10)
+
+    def _redraw_shapes(self, px_per_mm_f, x_off, y_off):
+        """Redraw the rectangle and all circles (the "shape" items)."""
+        self.canvas.delete("shape")
+        self._view = (px_per_mm_f, x_off, y_off)
 
         # draw rectangle
-        x0 = self.rect["x0_mm"]
-        y0 = self.rect["y0_mm"]
-        w = self.rect["w_mm"]
-        h = self.rect["h_mm"]
-
-        # corners in model mm (top-left origin)
-        p1 = (x0, y0)          # top-left
-        p2 = (x0 + w, y0)      # top-right
-        p3 = (x0 + w, y0 + h)  # bottom-right
-        p4 = (x0, y0 + h)      # bottom-left
-        pts_mm = [p1, p2, p3, p4]
-
-        pts_px = [self.mm_to_canvas_px(px, py, px_per_mm_f, x_off, y_off) for (px, py) in pts_mm]
-        flat = [coord for p in pts_px for coord in p]
-
-        # draw rectangle as polygon
-        self.canvas.create_polygon(flat, outline="#000", fill="#cfe8ff", width=1.5, tags="shape")
-        bbox_tl_px = self.mm_to_canvas_px(x0, y0, px_per_mm_f, x_off, y_off)
-        lbl = f"W={w} mm  H={h} mm"
-        self.canvas.create_text(bbox_tl_px[0] + 6, bbox_tl_px[1] + 6, text=lbl, anchor="nw", fill="#003366", font=("Arial", 10, "bold"), tags="shape")
-
-        # draw circles
-        for c in self.circles:
-            cx_mm = c["cx_mm"]
-            cy_mm = c["cy_mm"]
-            d_mm = c["d_mm"]
-            r_mm = d_mm / 2.0
-            # convert center to px
-            cx_px, cy_px = self.mm_to_canvas_px(cx_mm, cy_mm, px_per_mm_f, x_off, y_off)
-            r_px = r_mm * px_per_mm_f
-            self.canvas.create_oval(cx_px - r_px, cy_px - r_px, cx_px + r_px, cy_px + r_px,
-                                    outline="#900", fill="#ffdfdf", width=1.2, tags="shape")
-            # label diameter
-            self.canvas.create_text(cx_px + 4, cy_px - 4, text=f"Ø{int(round(d_mm))}mm", anchor="nw", font=("Arial", 8), tags="shape")
+        x0, y0, w, h = self._rect()
 
-        if self.auto_fit_var.get():
-            self.px_entry.state(["disabled"])
-        else:
-            self.px_entry.state(["!disabled"])
+        # rectangle edges in px (model mm is Y-up with a bottom-left origin, canvas px Y-down)
+        left_px = x0 * px_per_mm_f + x_off
+        right_px = (x0 + w) * px_per_mm_f + x_off
+        top_px = y_off - (y0 + h) * px_per_mm_f
+        bottom_px = y_off - y0 * px_per_mm_f
+
+        # draw rectangle as polygon (corners passed directly, clockwise from top-left)
+        self.canvas.create_polygon(left_px, top_px, right_px, top_px, right_px, bottom_px, left_px, bottom_px,
+                                   outline="#000", fill="#cfe8ff", width=1.5, tags="shape")
+        lbl = f"W={w} mm  H={h} mm"
+        self.canvas.create_text(left_px + 6, top_px + 6, text=lbl, anchor="nw", fill="#003366", font=("Arial", 10, "bold"), tags=("shape", "rect_label"))
+
+        self._circle_labels = {}
+        self._draw_circles(0, px_per_mm_f, x_off, y_off)
+
+    def _draw_circles(self, start, px_per_mm_f, x_off, y_off):
+        """Create canvas items for the circles from index start onward."""
+        # convert all centers/radii to px at once, then create the canvas items
+        cx_px_all = self._cx[start:] * px_per_mm_f + x_off
+        cy_px_all = y_off - self._cy[start:] * px_per_mm_f
+        r_px_all = 0.5 * self._d[start:] * px_per_mm_f
+        create_oval = self.canvas.create_oval
+        for i, (cx_px, cy_px, r_px, d_mm) in enumerate(zip(cx_px_all.tolist(), cy_px_all.tolist(), r_px_all.tolist(),
+                                                          self._d[start:].tolist()), start):
+            create_oval(cx_px - r_px, cy_px - r_px, cx_px + r_px, cy_px + r_px,
+                        outline="#900", fill="#ffdfdf", width=1.2, tags=("shape", "circle"))
+            # label diameter (only where the text fits inside the circle)
+            if r_px > CIRCLE_LABEL_MIN_R_PX:
+                self._draw_circle_label(i, cx_px, cy_px, d_mm)
+
+    def _draw_circle_label(self, i, cx_px, cy_px, d_mm):
+        self._circle_labels[i] = self.canvas.create_text(cx_px + 4, cy_px - 4, text=f"Ø{int(round(d_mm))}mm", anchor="nw",
+                                                         font=("Arial", 8), tags=("shape", "circle_label"))
+
+    def _sync_circle_labels(self, px_per_mm_f, x_off, y_off):
+        """After a zoom, add labels to circles that became large enough and drop those that became too small."""
+        show = set(np.flatnonzero(0.5 * self._d * px_per_mm_f > CIRCLE_LABEL_MIN_R_PX).tolist())
+        labels = self._circle_labels
+        for i in [i for i in labels if i not in show]:
+            self.canvas.delete(labels.pop(i))
+        missing = np.array(sorted(show.difference(labels)), dtype=int)
+        if len(missing):
+            cx_px_all = self._cx[missing] * px_per_mm_f + x_off
+            cy_px_all = y_off - self._cy[missing] * px_per_mm_f
+            for i, cx_px, cy_px, d_mm in zip(missing.tolist(), cx_px_all.tolist(), cy_px_all.tolist(), self._d[missing].tolist()):
+                self._draw_circle_label(i, cx_px, cy_px, d_mm)
 
     # -------------------- DXF export --------------------
     def _on_save_button(self):
@@ -542,10 +971,7 @@ class RectangleApp(tk.Tk):
 
     def save_dxf(self):
         try:
-            x0 = float(self.rect["x0_mm"])
-            y0 = float(self.rect["y0_mm"])
-            w = float(self.rect["w_mm"])
-            h = float(self.rect["h_mm"])
+            x0, y0, w, h = map(float, self._rect())
         except Exception:
             messagebox.showerror("Error", "Rectangle parameters invalid.")
             return
@@ -565,31 +991,19 @@ class RectangleApp(tk.Tk):
             if layer_name not in doc.layers:
                 doc.layers.new(name=layer_name, dxfattribs={"color": color})
 
-            # Rectangle points in model mm
+            # Rectangle points in model mm (model and DXF are both Y-up, so no conversion is needed)
             p1 = (x0, y0)
             p2 = (x0 + w, y0)
             p3 = (x0 + w, y0 + h)
             p4 = (x0, y0 + h)
-            pts_model = [p1, p2, p3, p4]
-
-            # To flip Y for DXF (so Y is up), compute canvas height in mm using the effective px_per_mm
-            effective_px_per_mm, x_off, y_off, bbox_min_x, bbox_min_y = self.compute_px_per_mm_and_offset()
-            try:
-                canvas_h_mm = self.canvas_h / effective_px_per_mm
-            except Exception:
-                canvas_h_mm = float(self.canvas_h)
-
-            # convert rectangle corners to DXF coords
-            pts_dxf = [(float(px), float(canvas_h_mm - py)) for (px, py) in pts_model]
-            msp.add_lwpolyline(pts_dxf, close=True, dxfattribs={"layer": layer_name, "color": color})
-
-            # add circles as DXF CIRCLE (center x, flipped y, radius in mm)
-            for c in self.circles:
-                cx = float(c["cx_mm"])
-                cy = float(c["cy_mm"])
-                r = float(c["d_mm"]) / 2.0
-                dxf_center = (cx, float(canvas_h_mm - cy))
-                msp.add_circle(dxf_center, r, dxfattribs={"layer": layer_name, "color": color})
+            msp.add_lwpolyline([p1, p2, p3, p4], close=True, dxfattribs={"layer": layer_name, "color": color})
+
+            # add circles as DXF CIRCLE (center, radius in mm);
+            # ezdxf copies dxfattribs, so one dict is shared by all circles
+            add_circle = msp.add_circle
+            attribs = {"layer": layer_name, "color": color}
+            for cx, cy, r in zip(self._cx.tolist(), self._cy.tolist(), (0.5 * self._d).tolist()):
+                add_circle((cx, cy), r, dxfattribs=attribs)
 
             doc.saveas(path)
             messagebox.showinfo("Saved", f"Saved DXF (mm) to: {path}")
@@ -0,0 +1,154 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled rejection sampler for equal circles, used by main_Version10.py when it can be built.
+Built on first import through pyximport (needs Cython and a C compiler):
+    pip install cython
+"""
+import numpy as np
+
+from libc.math cimport M_PI, floor, sqrt
+from libc.stdint cimport uint64_t
+
+
+cdef inline double _next_uniform(uint64_t *state) nogil:
+    # xorshift64* -> uniform double in [0, 1)
+    state[0] ^= state[0] >> 12
+    state[0] ^= state[0] << 25
+    state[0] ^= state[0] >> 27
+    return ((state[0] * 2685821657736338717ULL) >> 11) * (1.0 / 9007199254740992.0)
+
+
+cdef inline Py_ssize_t _cell_index(double v, double origin, double cell, Py_ssize_t n_cells) nogil:
+    cdef Py_ssize_t i = <Py_ssize_t>floor((v - origin) / cell)
+    if i < 0:
+        return 0
+    if i >= n_cells:
+        return n_cells - 1
+    return i
+
+
+def place_circles(double[:] ex_cx, double[:] ex_cy, double[:] ex_d, double diam, int count, double min_space,
+                  double x0, double y0, double w, double h, int max_attempts, unsigned long long seed,
+                  double max_fill=0.9, double jam_fill=0.547, int min_attempts=30):
+    """
+    Randomly place up to count circles of diameter diam inside the rectangle (x0, y0, w, h) (mm), keeping
+    min_space edge-to-edge to the rectangle edges, to the existing circles (centers ex_cx, ex_cy and
+    diameters ex_d) and to each other. Stops at the first circle that finds no spot in its attempts
+    (up to max_attempts, fewer while the rectangle is sparsely filled; see _try_place_circles).
+    Returns an (n, 3) array of cx, cy, r for the placed circles.
+    """
+    cdef Py_ssize_t n_existing = ex_cx.shape[0]
+    cdef Py_ssize_t total = n_existing + count
+    cdef double r = 0.5 * diam
+    cdef double lo_x = x0 + r + min_space
+    cdef double lo_y = y0 + r + min_space
+    cdef double span_x = w - 2.0 * (r + min_space)
+    cdef double span_y = h - 2.0 * (r + min_space)
+    cdef double max_r = r
+    cdef double cell, cx, cy, dx, dy, ma, grown, fill, reach
+    cdef Py_ssize_t i, j, k, a, ix, iy, gx, gy, nx, ny, n, attempts
+    # area of the placed circles grown by half the spacing, against the rectangle shrunk by the same
+    cdef double used_area = 0.0
+    cdef double fill_area = (w - min_space) * (h - min_space)
+    cdef bint ok, found
+    cdef uint64_t state = seed * 6364136223846793005ULL + 1442695040888963407ULL
+    if state == 0:
+        state = 88172645463325252ULL
+
+    placed = np.empty((count, 3))
+    cdef double[:, :] out = placed
+    if fill_area < 1e-12:
+        fill_area = 1e-12
+    if count <= 0 or span_x <= 0 or span_y <= 0:
+        return placed[:0]
+
+    all_x_arr = np.empty(total)
+    all_y_arr = np.empty(total)
+    ma1_arr = np.empty(total)
+    ma2_arr = np.empty(total)
+    cdef double[:] all_x = all_x_arr
+    cdef double[:] all_y = all_y_arr
+    # minimum center distance (and its square) from a new circle to each placed one
+    cdef double[:] ma1 = ma1_arr
+    cdef double[:] ma2 = ma2_arr
+
+    # uniform grid of linked lists (head[cell] -> nxt[i]); cells span the largest allowed center distance
+    for i in range(n_existing):
+        if 0.5 * ex_d[i] > max_r:
+            max_r = 0.5 * ex_d[i]
+    cell = r + max_r + min_space
+    if cell < sqrt(w * h / (4.0 * total + 1.0)):
+        cell = sqrt(w * h / (4.0 * total + 1.0))
+    nx = <Py_ssize_t>(w / cell) + 1
+    ny = <Py_ssize_t>(h / cell) + 1
+    head_arr = np.full(nx * ny, -1, dtype=np.intp)
+    nxt_arr = np.empty(total, dtype=np.intp)
+    cdef Py_ssize_t[:] head = head_arr
+    cdef Py_ssize_t[:] nxt = nxt_arr
+
+    n = 0
+    with nogil:
+        for i in range(total):
+            if i < n_existing:
+                cx = ex_cx[i]
+                cy = ex_cy[i]
+                ma = r + 0.5 * ex_d[i] + min_space
+                grown = 0.5 * ex_d[i] + 0.5 * min_space
+            else:
+                grown = r + 0.5 * min_space
+                fill = (used_area + M_PI * grown * grown) / fill_area
+                if fill > max_fill:
+                    break
+                fill = fill / jam_fill
+                if fill > 0.95:
+                    fill = 0.95
+                attempts = <Py_ssize_t>(50.0 / (1.0 - fill))
+                if attempts < min_attempts:
+                    attempts = min_attempts
+                if attempts > max_attempts:
+                    attempts = max_attempts
+                found = False
+                for a in range(attempts):
+                    cx = lo_x + span_x * _next_uniform(&state)
+                    cy = lo_y + span_y * _next_uniform(&state)
+                    ix = _cell_index(cx, x0, cell, nx)
+                    iy = _cell_index(cy, y0, cell, ny)
+                    ok = True
+                    gy = iy - 1 if iy > 0 else 0
+                    while ok and gy <= iy + 1 and gy < ny:
+                        gx = ix - 1 if ix > 0 else 0
+                        while ok and gx <= ix + 1 and gx < nx:
+                            j = head[gy * nx + gx]
+                            while j >= 0:
+                                dx = cx - all_x[j]
+                                dy = cy - all_y[j]
+                                if -ma1[j] < dx < ma1[j] and -ma1[j] < dy < ma1[j] and dx * dx + dy * dy < ma2[j]:
+                                    ok = False
+                                    break
+                                j = nxt[j]
+                            gx += 1
+                        gy += 1
+                    if ok:
+                        found = True
+                        break
+                if not found:
+                    break
+                ma = 2.0 * r + min_space
+                out[n - n_existing, 0] = cx
+                out[n - n_existing, 1] = cy
+                out[n - n_existing, 2] = r
+            all_x[n] = cx
+            all_y[n] = cy
+            ma1[n] = ma
+            ma2[n] = ma * ma
+            # only circles reaching into the rectangle (e.g. not ones left outside after it was changed) fill it
+            reach = grown + 0.5 * min_space
+            if x0 - reach < cx < x0 + w + reach and y0 - reach < cy < y0 + h + reach:
+                used_area += M_PI * grown * grown
+            # existing circles may lie outside a since-changed rectangle: clamp them into edge cells
+            k = _cell_index(cy, y0, cell, ny) * nx + _cell_index(cx, x0, cell, nx)
+            nxt[n] = head[k]
+            head[k] = n
+            n += 1
+
+    return placed[:n - n_existing]